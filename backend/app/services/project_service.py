@@ -8,8 +8,8 @@
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.core.db_utils import ensure_tz_aware, log_activity, soft_delete, update_project_activity
 from app.models.area import Area
@@ -38,6 +38,7 @@ def get_all(
         area_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[tuple[float, int, int]] = None,
     ) -> tuple[list[Project], int]:
         """
         Get all projects with optional filtering
@@ -46,8 +47,11 @@ def get_all(
             db: Database session
             status: Filter by status
             area_id: Filter by area
-            skip: Offset for pagination
+            skip: Offset for pagination (ignored when cursor is given)
             limit: Limit for pagination
+            cursor: Keyset cursor ``(momentum_score, priority, id)`` of the last
+                project on the previous page. Seeks past it instead of scanning
+                ``skip`` rows.
 
         Returns:
             Tuple of (projects, total_count)
@@ -79,14 +83,32 @@ def get_all(
             .label("completed_task_count")
         )
 
-        # Main query with task count annotations
+        # Main query with task count annotations (id breaks ties so pages are stable)
         query = (
             base.add_columns(task_count_sq, completed_task_count_sq)
             .options(joinedload(Project.area))
-            .order_by(Project.momentum_score.desc(), Project.priority)
-            .offset(skip)
+            .order_by(Project.momentum_score.desc(), Project.priority, Project.id)
             .limit(limit)
         )
+        if cursor is not None:
+            # Keyset pagination: rows strictly after the cursor in sort order
+            last_momentum, last_priority, last_id = cursor
+            query = query.where(
+                or_(
+                    Project.momentum_score < last_momentum,
+                    and_(
+                        Project.momentum_score == last_momentum,
+                        Project.priority > last_priority,
+                    ),
+                    and_(
+                        Project.momentum_score == last_momentum,
+                        Project.priority == last_priority,
+                        Project.id > last_id,
+                    ),
+                )
+            )
+        else:
+            query = query.offset(skip)
 
         rows = db.execute(query).unique().all()
         # Attach task counts as attributes on each project ORM object
@@ -117,7 +139,8 @@ def get_by_id(db: Session, project_id: int, include_tasks: bool = False) -> Opti
         query = query.options(joinedload(Project.area))
 
         if include_tasks:
-            query = query.options(joinedload(Project.tasks))
+            # SELECT ... IN for the collection: one extra query, no row fan-out
+            query = query.options(selectinload(Project.tasks))
 
         project = db.execute(query).unique().scalar_one_or_none()
 
@@ -419,6 +442,7 @@ def search(db: Session, search_term: str, limit: int = 20) -> list[Project]:
                     Project.description.ilike(search_pattern),
                 ),
             )
+            .options(joinedload(Project.area))  # Serialized by the API; avoid N+1
             .limit(limit)
         )
 
@@ -27,6 +27,7 @@ def calculate_urgency_zone(
     due_date: Optional[date],
     priority: int,
     current_zone: Optional[str] = None,
+    today: Optional[date] = None,
 ) -> str:
     """
     Calculate the appropriate MYN urgency zone based on task attributes.
@@ -41,11 +42,13 @@ def calculate_urgency_zone(
         due_date: Task's due date
         priority: Task priority (1-10, lower is higher priority)
         current_zone: Current zone if updating (for future zone_locked support)
+        today: Reference date; defaults to ``date.today()``
 
     Returns:
         Calculated urgency zone value
     """
-    today = date.today()
+    if today is None:
+        today = date.today()
 
     # Rule 1: Over the Horizon - tasks deferred to the future
     if defer_until and defer_until > today:
@@ -85,6 +88,7 @@ def recalculate_all_urgency_zones(db: Session) -> int:
     query = select(Task).where(Task.deleted_at.is_(None), Task.status.in_(active_statuses))
     tasks = db.execute(query).scalars().all()
 
+    today = date.today()
     updated_count = 0
     for task in tasks:
         new_zone = calculate_urgency_zone(
@@ -92,6 +96,7 @@ def recalculate_all_urgency_zones(db: Session) -> int:
             due_date=task.due_date,
             priority=task.priority,
             current_zone=task.urgency_zone,
+            today=today,
         )
         if task.urgency_zone != new_zone:
             task.urgency_zone = new_zone
@@ -194,6 +199,7 @@ def get_all(
                 Task.is_next_action.desc(),
                 Task.priority.desc(),
                 Task.due_date.nullslast(),
+                Task.id,
             )
             .offset(skip)
             .limit(limit)
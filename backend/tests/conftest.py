@@ -6,14 +6,18 @@
 
 Usage:
     def test_something(db_session):
-        # db_session is a fresh SQLAlchemy session with all tables created
+        # db_session runs inside a SAVEPOINT that is rolled back after the test
         project = Project(title="Test", status="active", priority=1)
         db_session.add(project)
         db_session.commit()
 """
 
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -21,8 +25,22 @@ def test_something(db_session):
 from app.models import Project, Task, Area, Goal, Vision, Context, InboxItem
 
 
-# Test database URL - in-memory SQLite for speed and isolation
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Test database URL - in-memory SQLite for speed and isolation. xdist-safe because
+# each worker is a separate process with its own in-memory database.
+TEST_DATABASE_URL = "sqlite://"
+
+
+class _ActiveTest:
+    """
+    Session of the currently running test, set and cleared by ``db_session``.
+
+    Lets longer-lived fixtures (e.g. a module-scoped TestClient) check that a
+    test SAVEPOINT is open before handing app code a session. Deliberately
+    plain module state rather than a ContextVar: it is read from the
+    TestClient's portal and threadpool threads.
+    """
+
+    db_session: Optional[Session] = None
 
 
 # =============================================================================
@@ -42,26 +60,97 @@ def _force_legacy_storage(monkeypatch):
     )
 
 
-@pytest.fixture(scope="function")
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep ``no_db`` tests off the database.
+
+    They are placed in their own xdist group, so under ``-n auto --dist loadgroup``
+    they share a worker that never builds the engine, and collection fails if
+    one of them requests a database fixture.
+    """
+    for item in items:
+        if item.get_closest_marker("no_db") is None:
+            continue
+        if "in_memory_engine" in getattr(item, "fixturenames", ()):
+            raise pytest.UsageError(f"{item.nodeid} is marked no_db but uses the database")
+        item.add_marker(pytest.mark.xdist_group("purefunc"))
+
+
+@pytest.fixture(scope="session")
 def in_memory_engine():
-    """Create an in-memory SQLite engine for testing."""
+    """
+    Create the in-memory SQLite engine once per test session (per xdist worker).
+
+    The schema is built a single time here; per-test isolation comes from the
+    SAVEPOINT rollback in ``db_session`` rather than create_all/drop_all.
+    """
     engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,  # Share single connection for in-memory SQLite
         echo=False,
     )
-    return engine
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # pysqlite issues its own BEGIN lazily, which breaks SAVEPOINT
+        # semantics. Hand transaction control to SQLAlchemy instead.
+        dbapi_connection.isolation_level = None
+        # Throwaway database: skip durability work on every commit. WAL is not
+        # an option here: SQLite keeps in-memory databases on the "memory"
+        # journal regardless, which is already the cheapest mode.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def connection(in_memory_engine):
+    """
+    Single connection holding an outer transaction for the whole session.
+
+    Nothing is ever committed to the database: every test runs inside a
+    SAVEPOINT on this connection that is rolled back at teardown.
+    """
+    conn = in_memory_engine.connect()
+    trans = conn.begin()
+    yield conn
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def session_factory(connection) -> sessionmaker:
+    """Factory for the test-side ``db_session``, bound to the shared connection."""
+    return sessionmaker(
+        bind=connection,
+        autoflush=False,
+        # Keep attributes loaded across commit(); tests expire explicitly when
+        # they need to observe fresh database state.
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
 
 @pytest.fixture(scope="function")
-def db_session(in_memory_engine):
+def db_session(connection, session_factory):
     """
-    Create a fresh database session for each test.
+    Create a database session for each test, isolated by a SAVEPOINT.
 
-    - Creates all tables before yielding
-    - Provides a session for the test
-    - Cleans up (closes session, drops tables) after test
+    - Opens a SAVEPOINT on the shared session-scoped connection
+    - Provides a session for the test; ``commit()`` calls inside the test
+      (or the code under test) only release inner SAVEPOINTs
+    - Rolls the SAVEPOINT back after the test so nothing leaks
 
     Usage:
         def test_create_project(db_session):
@@ -70,34 +159,164 @@ def test_create_project(db_session):
             db_session.commit()
             assert project.id is not None
     """
-    # Create all tables
-    Base.metadata.create_all(bind=in_memory_engine)
+    savepoint = connection.begin_nested()
+    session = session_factory()
 
-    # Create session
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=in_memory_engine)
-    session = SessionLocal()
+    _ActiveTest.db_session = session
 
     yield session
 
     # Cleanup
+    _ActiveTest.db_session = None
     session.close()
-    Base.metadata.drop_all(bind=in_memory_engine)
+    if savepoint.is_active:
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def request_session_factory(connection) -> sessionmaker:
+    """
+    Factory for the sessions app code gets through ``get_db``.
+
+    Mirrors production ``SessionLocal`` (notably the default
+    ``expire_on_commit=True``) so values are re-read from SQLite after commit,
+    as they are per request in the real app. Joins the running test's
+    SAVEPOINT, so its writes are rolled back with the test.
+    """
+    return sessionmaker(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture(scope="session")
+def override_get_db(request_session_factory):
+    """
+    get_db dependency override that opens a fresh session per request.
+
+    Safe to install once on a long-lived TestClient: sessions join the
+    SAVEPOINT of whichever test is currently executing. Tests using it must
+    request ``db_session`` (directly or via ``usefixtures``), and flush or
+    commit setup data before calling the API.
+    """
+    def _override_get_db():
+        if _ActiveTest.db_session is None:
+            raise RuntimeError("override_get_db requires the db_session fixture")
+        db = request_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return _override_get_db
+
+
+class QueryCounter:
+    """
+    Count SQL statements sent to the test engine inside a ``with`` block.
+
+    ``cache_misses`` lists the statements SQLAlchemy had to compile rather than
+    take from its compiled-statement cache.
+
+    Usage:
+        def test_no_n_plus_one(db_session, query_counter):
+            with query_counter:
+                ProjectService.get_all(db_session)
+            assert query_counter.count <= 2
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+        self.statements: list[str] = []
+        self.cache_misses: list[str] = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # The per-test SAVEPOINT a session opens on first use is not a query
+        if statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            return
+        self.count += 1
+        self.statements.append(statement)
+        if context.cache_hit is not CacheStats.CACHE_HIT:
+            self.cache_misses.append(statement)
+
+    def __enter__(self):
+        self.count = 0
+        self.statements = []
+        self.cache_misses = []
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.fixture
+def query_counter(in_memory_engine) -> QueryCounter:
+    """Statement counter for asserting query budgets (N+1 guards)."""
+    return QueryCounter(in_memory_engine)
+
+
+class LazyLoadError(AssertionError):
+    """Raised by ``no_lazy_loads`` when a relationship is lazy-loaded."""
+
+
+@pytest.fixture
+def no_lazy_loads(db_session):
+    """
+    N+1 guard: fail as soon as a relationship is lazy-loaded on db_session.
+
+    Every lazy load issues one query per parent row, so code under test must
+    eager-load (joinedload/selectinload) whatever it hands back to callers.
+    """
+    def _on_execute(orm_execute_state):
+        if not orm_execute_state.is_select:
+            return
+        state = orm_execute_state.lazy_loaded_from
+        if state is not None:
+            raise LazyLoadError(
+                f"Lazy load from {state.class_.__name__} detected:\n"
+                f"{orm_execute_state.statement}"
+            )
+
+    event.listen(db_session, "do_orm_execute", _on_execute)
+    yield
+    event.remove(db_session, "do_orm_execute", _on_execute)
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Fixed "current" UTC timestamp for building deterministic test data."""
+    return datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
 
 
 # =============================================================================
 # Test Data Factory Fixtures
 # =============================================================================
+#
+# Seed values are built once per session by the ``_*_template`` fixtures; the
+# function-scoped factories below only INSERT a fresh copy into the current
+# test's SAVEPOINT. The rows themselves cannot be session-scoped: many tests
+# assert on an empty or exactly-known database. Factories whose values depend
+# on the current time (``multiple_projects``) compute them per test instead.
+
+
+@pytest.fixture(scope="session")
+def _area_template() -> dict:
+    """Column values for ``sample_area``."""
+    return {
+        "title": "Test Area",
+        "description": "A test area of responsibility",
+        "standard_of_excellence": "Maintain high standards",
+        "review_frequency": "weekly",
+    }
 
 
 @pytest.fixture
-def sample_area(db_session) -> Area:
+def sample_area(db_session, _area_template) -> Area:
     """Create a sample area for testing."""
-    area = Area(
-        title="Test Area",
-        description="A test area of responsibility",
-        standard_of_excellence="Maintain high standards",
-        review_frequency="weekly",
-    )
+    area = Area(**_area_template)
     db_session.add(area)
     db_session.commit()
     return area
@@ -130,65 +349,72 @@ def sample_vision(db_session) -> Vision:
     return vision
 
 
+@pytest.fixture(scope="session")
+def _project_template() -> dict:
+    """Column values for ``sample_project`` (area_id is filled in per test)."""
+    return {
+        "title": "Test Project",
+        "description": "A test project",
+        "outcome_statement": "Successfully complete the test",
+        "status": "active",
+        "priority": 3,
+    }
+
+
 @pytest.fixture
-def sample_project(db_session, sample_area) -> Project:
+def sample_project(db_session, sample_area, _project_template) -> Project:
     """Create a sample project for testing."""
-    project = Project(
-        title="Test Project",
-        description="A test project",
-        outcome_statement="Successfully complete the test",
-        status="active",
-        priority=3,
-        area_id=sample_area.id,
-    )
+    project = Project(**_project_template, area_id=sample_area.id)
     db_session.add(project)
     db_session.commit()
     return project
 
 
+@pytest.fixture(scope="session")
+def _project_with_tasks_template() -> tuple[dict, list[dict]]:
+    """``(project values, task values)`` for ``sample_project_with_tasks``."""
+    project = {
+        "title": "Project With Tasks",
+        "description": "A project with tasks for testing",
+        "status": "active",
+        "priority": 2,
+    }
+    tasks = [
+        {
+            "title": "Task 1 - Next Action",
+            "status": "pending",
+            "priority": 1,
+            "is_next_action": True,
+        },
+        {
+            "title": "Task 2 - In Progress",
+            "status": "in_progress",
+            "priority": 2,
+        },
+        {
+            "title": "Task 3 - Completed",
+            "status": "completed",
+            "priority": 3,
+        },
+        {
+            "title": "Task 4 - Waiting",
+            "status": "waiting",
+            "priority": 4,
+            "waiting_for": "External review",
+        },
+    ]
+    return project, tasks
+
+
 @pytest.fixture
-def sample_project_with_tasks(db_session, sample_area) -> Project:
+def sample_project_with_tasks(db_session, sample_area, _project_with_tasks_template) -> Project:
     """Create a sample project with multiple tasks."""
-    project = Project(
-        title="Project With Tasks",
-        description="A project with tasks for testing",
-        status="active",
-        priority=2,
-        area_id=sample_area.id,
-    )
+    project_values, task_values = _project_with_tasks_template
+    project = Project(**project_values, area_id=sample_area.id)
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
 
-    # Add tasks
-    tasks = [
-        Task(
-            title="Task 1 - Next Action",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-        ),
-        Task(
-            title="Task 2 - In Progress",
-            project_id=project.id,
-            status="in_progress",
-            priority=2,
-        ),
-        Task(
-            title="Task 3 - Completed",
-            project_id=project.id,
-            status="completed",
-            priority=3,
-        ),
-        Task(
-            title="Task 4 - Waiting",
-            project_id=project.id,
-            status="waiting",
-            priority=4,
-            waiting_for="External review",
-        ),
-    ]
-    db_session.add_all(tasks)
+    db_session.add_all([Task(**values, project_id=project.id) for values in task_values])
     db_session.commit()
 
     # Refresh to load tasks relationship
@@ -196,18 +422,23 @@ def sample_project_with_tasks(db_session, sample_area) -> Project:
     return project
 
 
+@pytest.fixture(scope="session")
+def _task_template() -> dict:
+    """Column values for ``sample_task`` (project_id is filled in per test)."""
+    return {
+        "title": "Test Task",
+        "description": "A test task",
+        "status": "pending",
+        "priority": 3,
+        "is_next_action": True,
+        "urgency_zone": "opportunity_now",
+    }
+
+
 @pytest.fixture
-def sample_task(db_session, sample_project) -> Task:
+def sample_task(db_session, sample_project, _task_template) -> Task:
     """Create a sample task for testing."""
-    task = Task(
-        title="Test Task",
-        description="A test task",
-        project_id=sample_project.id,
-        status="pending",
-        priority=3,
-        is_next_action=True,
-        urgency_zone="opportunity_now",
-    )
+    task = Task(**_task_template, project_id=sample_project.id)
     db_session.add(task)
     db_session.commit()
     return task
@@ -228,7 +459,7 @@ def sample_inbox_item(db_session) -> InboxItem:
 @pytest.fixture
 def multiple_projects(db_session, sample_area) -> list[Project]:
     """Create multiple projects with varying states for testing."""
-    from datetime import datetime, timedelta, timezone
+    now = datetime.now(timezone.utc)
 
     projects = [
         Project(
@@ -237,7 +468,7 @@ def multiple_projects(db_session, sample_area) -> list[Project]:
             priority=1,
             area_id=sample_area.id,
             momentum_score=0.8,
-            last_activity_at=datetime.now(timezone.utc),
+            last_activity_at=now,
         ),
         Project(
             title="Active Low Priority",
@@ -245,7 +476,7 @@ def multiple_projects(db_session, sample_area) -> list[Project]:
             priority=8,
             area_id=sample_area.id,
             momentum_score=0.5,
-            last_activity_at=datetime.now(timezone.utc) - timedelta(days=5),
+            last_activity_at=now - timedelta(days=5),
         ),
         Project(
             title="Stalled Project",
@@ -253,8 +484,8 @@ def multiple_projects(db_session, sample_area) -> list[Project]:
             priority=3,
             area_id=sample_area.id,
             momentum_score=0.1,
-            last_activity_at=datetime.now(timezone.utc) - timedelta(days=20),
-            stalled_since=datetime.now(timezone.utc) - timedelta(days=6),
+            last_activity_at=now - timedelta(days=20),
+            stalled_since=now - timedelta(days=6),
         ),
         Project(
             title="Completed Project",
@@ -262,7 +493,7 @@ def multiple_projects(db_session, sample_area) -> list[Project]:
             priority=5,
             area_id=sample_area.id,
             momentum_score=1.0,
-            completed_at=datetime.now(timezone.utc) - timedelta(days=2),
+            completed_at=now - timedelta(days=2),
         ),
         Project(
             title="Someday Maybe",
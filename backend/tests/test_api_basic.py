@@ -7,7 +7,7 @@
 - In-memory SQLite for speed and isolation
 - Startup side-effects (scheduler, folder watcher) patched out
 
-Consolidated (DEBT-070): Uses shared in_memory_engine from conftest.py
+Consolidated (DEBT-070): Uses shared db_session from conftest.py
 """
 
 import json
@@ -15,39 +15,25 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
 
 from app.core.database import get_db
-from app.models.base import Base
 
 
 @pytest.fixture(scope="function")
-def test_client(in_memory_engine):
+def test_client(db_session, override_get_db):
     """
     Create a TestClient with proper database override.
 
-    Uses the shared in_memory_engine fixture from conftest.py (DEBT-070).
+    Uses the shared SAVEPOINT-isolated db_session fixture from conftest.py
+    (DEBT-070).
 
     This fixture:
-    1. Reuses the shared in-memory SQLite engine (with StaticPool)
-    2. Creates all tables
-    3. Overrides get_db dependency BEFORE creating TestClient
-    4. Patches startup side-effects (scheduler, folder watcher, urgency recalc)
-    5. Yields the TestClient for the test
-    6. Cleans up after
+    1. Reuses the session-scoped in-memory schema (no per-test create_all)
+    2. Overrides get_db dependency BEFORE creating TestClient
+    3. Patches startup side-effects (scheduler, folder watcher, urgency recalc)
+    4. Yields the TestClient for the test
+    5. Cleans up after (db_session rolls back the test's writes)
     """
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=in_memory_engine)
-
-    # Create all tables before anything else
-    Base.metadata.create_all(bind=in_memory_engine)
-
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
-
     # Import app and apply override BEFORE creating TestClient
     from app.main import app
 
@@ -69,7 +55,6 @@ def override_get_db():
 
     # Cleanup
     app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=in_memory_engine)
 
 
 class TestHealthEndpoints:
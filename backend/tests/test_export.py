@@ -6,34 +6,12 @@
 Note: These tests use direct database access to avoid startup event issues.
 """
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
-from app.models.base import Base
 from app.models import Project, Task, Area, Goal, Vision, InboxItem
 from app.services.export_service import ExportService
 
 
-# Test database (in-memory SQLite)
-TEST_DATABASE_URL = "sqlite:///:memory:"
-
-
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test"""
-    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-    Base.metadata.create_all(bind=engine)
-
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
-
-    yield session
-
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-
-
 class TestExportService:
     """Test ExportService methods directly"""
 
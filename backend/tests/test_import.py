@@ -17,21 +17,6 @@
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    engine = create_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(bind=engine)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-
-
 # ---------------------------------------------------------------------------
 # Minimal valid export fixture
 # ---------------------------------------------------------------------------
@@ -265,23 +250,10 @@ def test_export_then_import_round_trip(self, db_session: Session):
 class TestImportEndpoint:
 
     @pytest.fixture
-    def test_client(self, in_memory_engine):
+    def test_client(self, db_session, override_get_db):
         from unittest.mock import patch, AsyncMock
         from fastapi.testclient import TestClient
-        from sqlalchemy.orm import sessionmaker
         from app.core.database import get_db
-        from app.models.base import Base
-
-        TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False,
-                                           bind=in_memory_engine)
-        Base.metadata.create_all(bind=in_memory_engine)
-
-        def override_get_db():
-            try:
-                db = TestingSessionLocal()
-                yield db
-            finally:
-                db.close()
 
         from app.main import app
         app.dependency_overrides[get_db] = override_get_db
@@ -297,7 +269,6 @@ def override_get_db():
             yield client
 
         app.dependency_overrides.clear()
-        Base.metadata.drop_all(bind=in_memory_engine)
 
     def test_import_valid_export_returns_200(self, test_client):
         data = make_export(projects=[{
@@ -11,26 +11,14 @@
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
 
 from app.core.database import get_db
-from app.models.base import Base
 from app.models import InboxItem, Project, Task, WeeklyReviewCompletion
 
 
 @pytest.fixture(scope="function")
-def test_client(in_memory_engine):
+def test_client(db_session, override_get_db):
     """Create a TestClient with proper database override."""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=in_memory_engine)
-
-    Base.metadata.create_all(bind=in_memory_engine)
-
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
 
     from app.main import app
 
@@ -46,7 +34,6 @@ def override_get_db():
         yield client
 
     app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=in_memory_engine)
 
 
 @pytest.fixture
@@ -199,8 +186,6 @@ def test_stats_with_items(self, db_session, db_with_inbox_items):
         from app.api.inbox import get_inbox_stats
 
         # Direct service test using db_session
-        now = datetime.now(timezone.utc)
-
         # Count unprocessed: should be 3
         unprocessed = db_session.query(InboxItem).filter(
             InboxItem.processed_at.is_(None)
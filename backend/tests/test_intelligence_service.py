@@ -878,7 +878,6 @@ def test_breakdown_structure(self, db_session: Session, sample_area: Area):
 
     def test_breakdown_next_action_detail_graduated(self, db_session: Session, sample_area: Area):
         """BETA-001: Breakdown shows graduated next-action detail."""
-        now = datetime.now(timezone.utc)
         project = Project(
             title="NA Detail Test",
             status="active",
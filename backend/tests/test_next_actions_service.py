@@ -12,6 +12,12 @@
 from app.services.next_actions_service import NextActionsService
 
 
+def assert_titles_equal(results, expected):
+    """Assert the result set contains exactly the expected task titles."""
+    __tracebackhide__ = True
+    assert sorted(r.title for r in results) == sorted(expected)
+
+
 class TestGetPrioritizedNextActions:
     """Test NextActionsService get_prioritized_next_actions."""
 
@@ -145,40 +151,40 @@ def test_excludes_deferred_tasks(self, db_session: Session, sample_area: Area):
         tomorrow = date.today() + timedelta(days=1)
         yesterday = date.today() - timedelta(days=1)
 
-        deferred_task = Task(
-            title="Deferred Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            defer_until=tomorrow,
-        )
-        ready_task = Task(
-            title="Ready Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            defer_until=yesterday,
+        db_session.bulk_insert_mappings(
+            Task,
+            [
+                {
+                    "title": "Deferred Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "defer_until": tomorrow,
+                },
+                {
+                    "title": "Ready Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "defer_until": yesterday,
+                },
+                {
+                    "title": "No Defer Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "defer_until": None,
+                },
+            ],
         )
-        no_defer_task = Task(
-            title="No Defer Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            defer_until=None,
-        )
-        db_session.add_all([deferred_task, ready_task, no_defer_task])
         db_session.commit()
 
         results = NextActionsService.get_prioritized_next_actions(db_session)
 
-        assert len(results) == 2
-        titles = [t.title for t in results]
-        assert "Ready Task" in titles
-        assert "No Defer Task" in titles
-        assert "Deferred Task" not in titles
+        assert_titles_equal(results, ["Ready Task", "No Defer Task"])
 
     def test_filter_by_context(self, db_session: Session, sample_area: Area):
         """Test filtering by context."""
@@ -268,42 +274,43 @@ def test_filter_by_time_available(self, db_session: Session, sample_area: Area):
         db_session.add(project)
         db_session.commit()
 
-        short_task = Task(
-            title="Short Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            estimated_minutes=10,
-        )
-        long_task = Task(
-            title="Long Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            estimated_minutes=60,
+        db_session.bulk_insert_mappings(
+            Task,
+            [
+                {
+                    "title": "Short Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "estimated_minutes": 10,
+                },
+                {
+                    "title": "Long Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "estimated_minutes": 60,
+                },
+                {
+                    "title": "No Estimate Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "estimated_minutes": None,
+                },
+            ],
         )
-        no_estimate_task = Task(
-            title="No Estimate Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            estimated_minutes=None,
-        )
-        db_session.add_all([short_task, long_task, no_estimate_task])
         db_session.commit()
 
         results = NextActionsService.get_prioritized_next_actions(
             db_session, time_available=15
         )
 
-        assert len(results) == 2
-        titles = [t.title for t in results]
-        assert "Short Task" in titles
-        assert "No Estimate Task" in titles  # None passes the filter
-        assert "Long Task" not in titles
+        # None passes the filter; "Long Task" is excluded
+        assert_titles_equal(results, ["Short Task", "No Estimate Task"])
 
     def test_respects_limit(self, db_session: Session, sample_area: Area):
         """Test that limit parameter is respected."""
@@ -434,39 +441,43 @@ def test_groups_by_context(self, db_session: Session, sample_area: Area):
         db_session.add(project)
         db_session.commit()
 
-        computer_task = Task(
-            title="Computer Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            context="@computer",
-        )
-        phone_task1 = Task(
-            title="Phone Task 1",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            context="@phone",
-        )
-        phone_task2 = Task(
-            title="Phone Task 2",
-            project_id=project.id,
-            status="pending",
-            priority=2,
-            is_next_action=True,
-            context="@phone",
-        )
-        no_context_task = Task(
-            title="No Context Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-            context=None,
+        db_session.bulk_insert_mappings(
+            Task,
+            [
+                {
+                    "title": "Computer Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "context": "@computer",
+                },
+                {
+                    "title": "Phone Task 1",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "context": "@phone",
+                },
+                {
+                    "title": "Phone Task 2",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 2,
+                    "is_next_action": True,
+                    "context": "@phone",
+                },
+                {
+                    "title": "No Context Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                    "context": None,
+                },
+            ],
         )
-        db_session.add_all([computer_task, phone_task1, phone_task2, no_context_task])
         db_session.commit()
 
         results = NextActionsService.get_next_actions_by_context(db_session)
@@ -578,33 +589,37 @@ def test_dashboard_with_data(self, db_session: Session, sample_area: Area):
         db_session.add(project)
         db_session.commit()
 
-        # Create a next action (top priority)
-        next_action = Task(
-            title="Priority Task",
-            project_id=project.id,
-            status="pending",
-            priority=1,
-            is_next_action=True,
-        )
-        # Create quick win
-        quick_win = Task(
-            title="Quick Win",
-            project_id=project.id,
-            status="pending",
-            priority=3,
-            is_next_action=True,
-            estimated_minutes=10,
-        )
-        # Create due today task
-        due_today_task = Task(
-            title="Due Today",
-            project_id=project.id,
-            status="pending",
-            priority=2,
-            is_next_action=False,
-            due_date=date.today(),
+        db_session.bulk_insert_mappings(
+            Task,
+            [
+                # Next action (top priority)
+                {
+                    "title": "Priority Task",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 1,
+                    "is_next_action": True,
+                },
+                # Quick win
+                {
+                    "title": "Quick Win",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 3,
+                    "is_next_action": True,
+                    "estimated_minutes": 10,
+                },
+                # Due today task
+                {
+                    "title": "Due Today",
+                    "project_id": project.id,
+                    "status": "pending",
+                    "priority": 2,
+                    "is_next_action": False,
+                    "due_date": date.today(),
+                },
+            ],
         )
-        db_session.add_all([next_action, quick_win, due_today_task])
         db_session.commit()
 
         dashboard = NextActionsService.get_daily_dashboard(db_session)
@@ -6,6 +6,7 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import Project, Task, Area
@@ -64,16 +65,22 @@ def test_get_by_id_not_found(self, db_session: Session):
 
         assert project is None
 
-    def test_get_by_id_with_tasks(self, db_session: Session, sample_project_with_tasks: Project):
+    def test_get_by_id_with_tasks(
+        self, db_session: Session, sample_project_with_tasks: Project, query_counter
+    ):
         """Test getting a project with tasks eagerly loaded."""
-        project = ProjectService.get_by_id(
-            db_session, sample_project_with_tasks.id, include_tasks=True
-        )
+        project_id = sample_project_with_tasks.id
+        db_session.expire_all()  # Force tasks to come from get_by_id, not the identity map
+
+        with query_counter:
+            project = ProjectService.get_by_id(db_session, project_id, include_tasks=True)
+            assert project is not None
+            assert len(project.tasks) == 4
+            task_titles = [t.title for t in project.tasks]
 
-        assert project is not None
-        assert len(project.tasks) == 4
-        task_titles = [t.title for t in project.tasks]
         assert "Task 1 - Next Action" in task_titles
+        # One query for the project (+ area), one SELECT ... IN for its tasks
+        assert query_counter.count <= 2, query_counter.statements
 
     def test_update_project(self, db_session: Session, sample_project: Project):
         """Test updating a project."""
@@ -116,6 +123,7 @@ def test_delete_project_not_found(self, db_session: Session):
         assert result is False
 
 
+@pytest.mark.usefixtures("no_lazy_loads")
 class TestProjectServiceGetAll:
     """Test ProjectService get_all with filtering and pagination."""
 
@@ -142,16 +150,22 @@ def test_get_all_filter_by_status(self, db_session: Session, multiple_projects:
 
     def test_get_all_filter_by_area(self, db_session: Session, multiple_projects: list[Project], sample_area: Area):
         """Test get_all with area filter."""
-        projects, total = ProjectService.get_all(db_session, area_id=sample_area.id)
+        area_id = sample_area.id
+        db_session.expunge_all()  # Areas must come from the query, not the identity map
+        projects, total = ProjectService.get_all(db_session, area_id=area_id)
 
         # 4 projects have area_id set (all except Someday Maybe)
         assert total == 4
-        assert all(p.area_id == sample_area.id for p in projects)
+        assert all(p.area_id == area_id for p in projects)
+        assert all(p.area.title == "Test Area" for p in projects)
 
     def test_get_all_pagination(self, db_session: Session, multiple_projects: list[Project]):
-        """Test get_all with pagination."""
-        projects_page1, total = ProjectService.get_all(db_session, skip=0, limit=2)
-        projects_page2, _ = ProjectService.get_all(db_session, skip=2, limit=2)
+        """Test get_all with keyset (cursor) pagination."""
+        projects_page1, total = ProjectService.get_all(db_session, limit=2)
+        last = projects_page1[-1]
+        projects_page2, _ = ProjectService.get_all(
+            db_session, limit=2, cursor=(last.momentum_score, last.priority, last.id)
+        )
 
         assert total == 5
         assert len(projects_page1) == 2
@@ -161,6 +175,19 @@ def test_get_all_pagination(self, db_session: Session, multiple_projects: list[P
         page2_ids = {p.id for p in projects_page2}
         assert page1_ids.isdisjoint(page2_ids)
 
+    def test_get_all_cursor_matches_offset(
+        self, db_session: Session, multiple_projects: list[Project]
+    ):
+        """Test cursor pages line up with the skip-based fallback."""
+        page1, _ = ProjectService.get_all(db_session, skip=0, limit=2)
+        last = page1[-1]
+        by_cursor, _ = ProjectService.get_all(
+            db_session, limit=2, cursor=(last.momentum_score, last.priority, last.id)
+        )
+        by_offset, _ = ProjectService.get_all(db_session, skip=2, limit=2)
+
+        assert [p.id for p in by_cursor] == [p.id for p in by_offset]
+
     def test_get_all_ordered_by_momentum_and_priority(self, db_session: Session, multiple_projects: list[Project]):
         """Test get_all returns projects ordered by momentum desc, then priority."""
         projects, _ = ProjectService.get_all(db_session)
@@ -233,17 +260,20 @@ def test_get_stalled_projects_excludes_non_active(self, db_session: Session, sam
         assert len(result) == 0
 
 
+@pytest.mark.usefixtures("no_lazy_loads")
 class TestProjectServiceSearch:
     """Test ProjectService search functionality."""
 
     def test_search_by_title(self, db_session: Session, multiple_projects: list[Project]):
         """Test searching projects by title."""
+        db_session.expunge_all()  # Areas must come from the query, not the identity map
         results = ProjectService.search(db_session, "Active")
 
         assert len(results) == 2
         titles = [p.title for p in results]
         assert "Active High Priority" in titles
         assert "Active Low Priority" in titles
+        assert all(p.area.title == "Test Area" for p in results)
 
     def test_search_by_description(self, db_session: Session, sample_area: Area):
         """Test searching projects by description."""
@@ -277,14 +307,18 @@ def test_search_no_results(self, db_session: Session, multiple_projects: list[Pr
     def test_search_limit(self, db_session: Session, sample_area: Area):
         """Test search respects limit parameter."""
         # Create many projects
-        for i in range(10):
-            project = Project(
-                title=f"Search Test Project {i}",
-                status="active",
-                priority=5,
-                area_id=sample_area.id,
-            )
-            db_session.add(project)
+        db_session.execute(
+            insert(Project),
+            [
+                {
+                    "title": f"Search Test Project {i}",
+                    "status": "active",
+                    "priority": 5,
+                    "area_id": sample_area.id,
+                }
+                for i in range(10)
+            ],
+        )
         db_session.commit()
 
         results = ProjectService.search(db_session, "Search Test", limit=3)
@@ -337,7 +371,7 @@ def test_get_health_status_strong(self, db_session: Session, sample_area: Area):
         # With momentum 0.85 and no activity timestamp, status is "strong"
         assert health.health_status == "strong"
 
-    def test_get_health_status_stalled(self, db_session: Session, sample_area: Area):
+    def test_get_health_status_stalled(self, db_session: Session, sample_area: Area, now: datetime):
         """Test health status is 'stalled' for stalled project."""
         project = Project(
             title="Stalled Project",
@@ -345,7 +379,7 @@ def test_get_health_status_stalled(self, db_session: Session, sample_area: Area)
             priority=3,
             area_id=sample_area.id,
             momentum_score=0.1,
-            stalled_since=datetime.now(timezone.utc) - timedelta(days=5),
+            stalled_since=now - timedelta(days=5),
         )
         db_session.add(project)
         db_session.commit()
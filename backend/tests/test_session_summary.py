@@ -9,15 +9,15 @@
 - Idempotent session-latest upsert
 """
 
-from datetime import datetime, timedelta, timezone
+from contextlib import ExitStack
+from datetime import timedelta
 from unittest.mock import patch, AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
 from app.core.database import get_db
-from app.models.base import Base
 from app.models.project import Project
 from app.models.task import Task
 from app.models.activity_log import ActivityLog
@@ -26,53 +26,52 @@
 from app.modules.memory_layer.models import MemoryObject, MemoryNamespace  # noqa: F401
 
 
-@pytest.fixture(scope="function")
-def test_client(in_memory_engine):
-    """Create a TestClient with proper database override for session summary tests."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=in_memory_engine
-    )
+# Every test needs a db_session so the shared client's get_db has one to resolve.
+pytestmark = pytest.mark.usefixtures("db_session")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_app_startup():
+    """Patch app startup side-effects once for the whole module."""
+    with ExitStack() as stack:
+        stack.enter_context(patch("app.core.database.init_db"))
+        stack.enter_context(patch("app.main.enable_wal_mode"))
+        stack.enter_context(patch("app.main.register_modules", return_value=set()))
+        stack.enter_context(patch("app.main.mount_module_routers"))
+        stack.enter_context(patch("app.services.scheduler_service.start_scheduler"))
+        stack.enter_context(
+            patch(
+                "app.services.scheduler_service.run_urgency_zone_recalculation_now",
+                new_callable=AsyncMock,
+            )
+        )
+        yield
+
 
-    Base.metadata.create_all(bind=in_memory_engine)
+@pytest.fixture(scope="module")
+def test_client(request, override_get_db):
+    """
+    Create one TestClient for the whole module.
 
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
+    The get_db override resolves the per-test SAVEPOINT session at request
+    time, so DB isolation stays per-test while app wiring is set up once.
 
+    The client is deliberately not entered as a context manager: that would
+    run the app lifespan, which applies Alembic migrations and seeds contexts
+    against the configured DATABASE_PATH rather than the test engine. Without
+    it, no lifespan startup/shutdown is paid at all.
+    """
     from app.main import app
 
     app.dependency_overrides[get_db] = override_get_db
-
-    with (
-        patch("app.core.database.init_db"),
-        patch("app.main.enable_wal_mode"),
-        patch("app.main.register_modules", return_value=set()),
-        patch("app.main.mount_module_routers"),
-        patch("app.services.scheduler_service.start_scheduler"),
-        patch(
-            "app.services.scheduler_service.run_urgency_zone_recalculation_now",
-            new_callable=AsyncMock,
-        ),
-    ):
-        client = TestClient(app)
-        yield client
-
-    app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=in_memory_engine)
+    request.addfinalizer(app.dependency_overrides.clear)
+    return TestClient(app)
 
 
 @pytest.fixture
-def session_db(in_memory_engine, test_client):
-    """Get a DB session that shares the same engine as the test client."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=in_memory_engine
-    )
-    session = TestingSessionLocal()
-    yield session
-    session.close()
+def session_db(db_session, test_client):
+    """Test-side session sharing the SAVEPOINT the client's requests join."""
+    return db_session
 
 
 class TestSessionSummaryEmpty:
@@ -98,10 +97,8 @@ def test_empty_session_returns_zero_counts(self, test_client):
 class TestSessionSummaryWithData:
     """Test session summary with task completions and momentum."""
 
-    def test_session_with_completions(self, test_client, session_db):
+    def test_session_with_completions(self, test_client, session_db, now):
         """Session with completed tasks returns correct counts and summary."""
-        now = datetime.now(timezone.utc)
-
         project = Project(
             title="Test Project",
             status="active",
@@ -109,15 +106,16 @@ def test_session_with_completions(self, test_client, session_db):
             momentum_score=0.65,
         )
         session_db.add(project)
-        session_db.commit()
+        session_db.flush()
 
-        # 2 completed tasks, 1 new task
+        # 2 completed tasks created before the session, 1 new task created during it
         t1 = Task(
             title="Completed Task 1",
             project_id=project.id,
             status="completed",
             priority=1,
             completed_at=now - timedelta(minutes=30),
+            created_at=now - timedelta(hours=3),
         )
         t2 = Task(
             title="Completed Task 2",
@@ -125,21 +123,17 @@ def test_session_with_completions(self, test_client, session_db):
             status="completed",
             priority=2,
             completed_at=now - timedelta(minutes=15),
+            created_at=now - timedelta(hours=3),
         )
         t3 = Task(
             title="New Task",
             project_id=project.id,
             status="pending",
             priority=3,
+            created_at=now - timedelta(minutes=10),
         )
         session_db.add_all([t1, t2, t3])
-        session_db.commit()
-
-        # Set created_at: t1/t2 created before session, t3 created during session
-        t1.created_at = now - timedelta(hours=3)
-        t2.created_at = now - timedelta(hours=3)
-        t3.created_at = now - timedelta(minutes=10)
-        session_db.commit()
+        session_db.flush()
 
         # Activity log entries
         a1 = ActivityLog(
@@ -174,10 +168,8 @@ def test_session_with_completions(self, test_client, session_db):
         assert "Completed 2 tasks" in data["summary_text"]
         assert "Created 1 new task" in data["summary_text"]
 
-    def test_session_with_momentum_changes(self, test_client, session_db):
+    def test_session_with_momentum_changes(self, test_client, session_db, now):
         """Session shows momentum deltas for touched projects."""
-        now = datetime.now(timezone.utc)
-
         project = Project(
             title="Momentum Project",
             status="active",
@@ -280,19 +272,21 @@ def test_persist_updates_existing_latest(self, test_client, session_db):
         assert response2.json()["persisted"] is True
 
         # Only one session-latest should exist
-        latest_count = (
+        latest_rows = (
             session_db.query(MemoryObject)
             .filter(MemoryObject.object_id == "session-latest")
-            .count()
-        )
-        assert latest_count == 1
-
-        latest = (
-            session_db.query(MemoryObject)
-            .filter(MemoryObject.object_id == "session-latest")
-            .first()
+            .all()
         )
-        assert latest.content["user_notes"] == "Second"
+        assert len(latest_rows) == 1
+        assert latest_rows[0].content["user_notes"] == "Second"
+
+    def test_object_id_lookup_uses_index(self, session_db):
+        """Verification lookups by object_id are index seeks, not table scans."""
+        plan = session_db.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM memory_objects WHERE object_id = :oid"),
+            {"oid": "session-latest"},
+        ).all()
+        assert any("idx_memory_object_id" in row[-1] for row in plan)
 
 
 class TestSessionSummaryValidation:
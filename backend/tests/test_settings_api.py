@@ -13,26 +13,13 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
 
 from app.core.database import get_db
-from app.models.base import Base
 
 
 @pytest.fixture(scope="function")
-def test_client(in_memory_engine):
+def test_client(db_session, override_get_db):
     """Create a TestClient with proper database override for settings tests."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=in_memory_engine
-    )
-    Base.metadata.create_all(bind=in_memory_engine)
-
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
 
     from app.main import app
 
@@ -53,7 +40,6 @@ def override_get_db():
         yield client
 
     app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=in_memory_engine)
 
 
 class TestMomentumSettings:
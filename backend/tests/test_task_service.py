@@ -6,6 +6,7 @@
 
 import pytest
 from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import Project, Task, Area
@@ -13,108 +14,57 @@
 from app.services.task_service import TaskService, calculate_urgency_zone
 
 
-class TestCalculateUrgencyZone:
-    """Test the urgency zone calculation function."""
-
-    def test_over_the_horizon_with_future_defer(self):
-        """Test that tasks deferred to the future are Over the Horizon."""
-        tomorrow = date.today() + timedelta(days=1)
-        zone = calculate_urgency_zone(
-            defer_until=tomorrow,
-            due_date=None,
-            priority=5,
-        )
-        assert zone == "over_the_horizon"
-
-    def test_critical_now_due_today_high_priority(self):
-        """Test that high priority tasks due today are Critical Now."""
-        today = date.today()
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=today,
-            priority=2,  # High priority (1-3)
-        )
-        assert zone == "critical_now"
-
-    def test_critical_now_due_today_low_priority(self):
-        """Test that all tasks due today are Critical Now regardless of priority."""
-        today = date.today()
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=today,
-            priority=5,  # Low priority (4+)
-        )
-        assert zone == "critical_now"
-
-    def test_critical_now_overdue(self):
-        """Test that overdue tasks are Critical Now regardless of priority."""
-        yesterday = date.today() - timedelta(days=1)
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=yesterday,
-            priority=8,  # Low priority
-        )
-        assert zone == "critical_now"
-
-    def test_critical_now_overdue_multiple_days(self):
-        """Test that tasks overdue by many days are Critical Now."""
-        long_overdue = date.today() - timedelta(days=10)
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=long_overdue,
-            priority=5,
-        )
-        assert zone == "critical_now"
+# Shared TaskCreate payload; tests override the fields they care about
+_TASK_CREATE_BASE = {"title": "New Task", "status": "pending", "priority": 3}
 
-    def test_critical_now_due_tomorrow_high_priority(self):
-        """Test that high priority tasks due tomorrow are Critical Now."""
-        tomorrow = date.today() + timedelta(days=1)
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=tomorrow,
-            priority=2,  # High priority
-        )
-        assert zone == "critical_now"
+# Fixed reference date so the overdue/defer boundaries never straddle midnight.
+TODAY = date(2025, 1, 15)
 
-    def test_opportunity_now_due_tomorrow_low_priority(self):
-        """Test that low priority tasks due tomorrow are Opportunity Now."""
-        tomorrow = date.today() + timedelta(days=1)
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=tomorrow,
-            priority=5,  # Low priority
-        )
-        assert zone == "opportunity_now"
 
-    def test_opportunity_now_default(self):
-        """Test that default zone is Opportunity Now."""
-        zone = calculate_urgency_zone(
-            defer_until=None,
-            due_date=None,
-            priority=5,
-        )
-        assert zone == "opportunity_now"
+@pytest.mark.no_db
+class TestCalculateUrgencyZone:
+    """Test the urgency zone calculation function."""
 
-    def test_opportunity_now_past_defer_date(self):
-        """Test that tasks with past defer date are Opportunity Now."""
-        yesterday = date.today() - timedelta(days=1)
+    @pytest.mark.parametrize(
+        "defer_offset,due_offset,priority,expected",
+        [
+            (1, None, 5, "over_the_horizon"),
+            (None, 0, 2, "critical_now"),  # High priority (1-3)
+            (None, 0, 5, "critical_now"),  # Due today, any priority
+            (None, -1, 8, "critical_now"),  # Overdue, any priority
+            (None, -10, 5, "critical_now"),
+            (None, 1, 2, "critical_now"),
+            (None, 1, 5, "opportunity_now"),
+            (None, None, 5, "opportunity_now"),
+            (-1, None, 5, "opportunity_now"),
+            (None, 0, 3, "critical_now"),  # Threshold priority
+            (None, 0, 4, "critical_now"),  # Just below threshold, still due today
+        ],
+        ids=[
+            "over_the_horizon_with_future_defer",
+            "critical_now_due_today_high_priority",
+            "critical_now_due_today_low_priority",
+            "critical_now_overdue",
+            "critical_now_overdue_multiple_days",
+            "critical_now_due_tomorrow_high_priority",
+            "opportunity_now_due_tomorrow_low_priority",
+            "opportunity_now_default",
+            "opportunity_now_past_defer_date",
+            "critical_now_threshold_due_today_p3",
+            "critical_now_threshold_due_today_p4",
+        ],
+    )
+    def test_calculate_urgency_zone(self, defer_offset, due_offset, priority, expected):
+        """Test zone assignment for defer/due offsets (in days) relative to TODAY."""
+        defer_until = None if defer_offset is None else TODAY + timedelta(days=defer_offset)
+        due_date = None if due_offset is None else TODAY + timedelta(days=due_offset)
         zone = calculate_urgency_zone(
-            defer_until=yesterday,
-            due_date=None,
-            priority=5,
+            defer_until=defer_until,
+            due_date=due_date,
+            priority=priority,
+            today=TODAY,
         )
-        assert zone == "opportunity_now"
-
-    def test_critical_now_threshold_due_today(self):
-        """Test that all tasks due today are Critical Now regardless of priority."""
-        today = date.today()
-        # Priority 3 should be Critical Now
-        zone3 = calculate_urgency_zone(defer_until=None, due_date=today, priority=3)
-        assert zone3 == "critical_now"
-
-        # Priority 4 should also be Critical Now (due today)
-        zone4 = calculate_urgency_zone(defer_until=None, due_date=today, priority=4)
-        assert zone4 == "critical_now"
+        assert zone == expected
 
 
 class TestTaskServiceCRUD:
@@ -122,12 +72,12 @@ class TestTaskServiceCRUD:
 
     def test_create_task(self, db_session: Session, sample_project: Project):
         """Test creating a new task."""
-        task_data = TaskCreate(
-            title="New Task",
-            description="A test task description",
-            status="pending",
-            priority=3,
-            project_id=sample_project.id,
+        task_data = TaskCreate.model_validate(
+            {
+                **_TASK_CREATE_BASE,
+                "description": "A test task description",
+                "project_id": sample_project.id,
+            }
         )
 
         task = TaskService.create(db_session, task_data)
@@ -143,12 +93,14 @@ def test_create_task(self, db_session: Session, sample_project: Project):
     def test_create_task_auto_calculates_urgency_zone(self, db_session: Session, sample_project: Project):
         """Test that creating a task auto-calculates urgency zone."""
         tomorrow = date.today() + timedelta(days=1)
-        task_data = TaskCreate(
-            title="Deferred Task",
-            status="pending",
-            priority=5,
-            project_id=sample_project.id,
-            defer_until=tomorrow,
+        task_data = TaskCreate.model_validate(
+            {
+                **_TASK_CREATE_BASE,
+                "title": "Deferred Task",
+                "priority": 5,
+                "project_id": sample_project.id,
+                "defer_until": tomorrow,
+            }
         )
 
         task = TaskService.create(db_session, task_data)
@@ -158,18 +110,20 @@ def test_create_task_auto_calculates_urgency_zone(self, db_session: Session, sam
     def test_create_task_with_all_fields(self, db_session: Session, sample_project: Project):
         """Test creating a task with all optional fields."""
         due_date = date.today() + timedelta(days=7)
-        task_data = TaskCreate(
-            title="Full Task",
-            description="Complete description",
-            status="pending",
-            priority=2,
-            project_id=sample_project.id,
-            context="@computer",
-            energy_level="high",
-            estimated_minutes=30,
-            is_next_action=True,
-            is_two_minute_task=False,
-            due_date=due_date,
+        task_data = TaskCreate.model_validate(
+            {
+                **_TASK_CREATE_BASE,
+                "title": "Full Task",
+                "description": "Complete description",
+                "priority": 2,
+                "project_id": sample_project.id,
+                "context": "@computer",
+                "energy_level": "high",
+                "estimated_minutes": 30,
+                "is_next_action": True,
+                "is_two_minute_task": False,
+                "due_date": due_date,
+            }
         )
 
         task = TaskService.create(db_session, task_data)
@@ -195,13 +149,20 @@ def test_get_by_id_not_found(self, db_session: Session):
 
         assert task is None
 
-    def test_get_by_id_with_project(self, db_session: Session, sample_task: Task):
+    def test_get_by_id_with_project(self, db_session: Session, sample_task: Task, query_counter):
         """Test getting a task with project eagerly loaded."""
-        task = TaskService.get_by_id(db_session, sample_task.id, include_project=True)
+        task_id = sample_task.id
+        db_session.expire_all()  # Force project to come from get_by_id, not the identity map
 
-        assert task is not None
-        assert task.project is not None
-        assert task.project.title == "Test Project"
+        with query_counter:
+            task = TaskService.get_by_id(db_session, task_id, include_project=True)
+            assert task is not None
+            assert task.project is not None
+            project_title = task.project.title
+
+        assert project_title == "Test Project"
+        # Many-to-one is joined into the task SELECT
+        assert query_counter.count == 1, query_counter.statements
 
     def test_update_task(self, db_session: Session, sample_task: Task):
         """Test updating a task."""
@@ -272,6 +233,20 @@ def test_get_all_returns_tasks(self, db_session: Session, sample_project_with_ta
         assert total == 3
         assert len(tasks) == 3
 
+    def test_get_all_include_project_query_count(
+        self, db_session: Session, sample_project_with_tasks: Project, query_counter
+    ):
+        """Test get_all(include_project=True) loads projects without per-row queries."""
+        db_session.expire_all()
+
+        with query_counter:
+            tasks, _ = TaskService.get_all(db_session, include_project=True)
+            titles = {t.project.title for t in tasks}
+
+        assert titles == {"Project With Tasks"}
+        # COUNT + one SELECT with the project joined in
+        assert query_counter.count == 2, query_counter.statements
+
     def test_get_all_show_completed(self, db_session: Session, sample_project_with_tasks: Project):
         """Test get_all with show_completed=True."""
         tasks, total = TaskService.get_all(db_session, show_completed=True)
@@ -289,7 +264,7 @@ def test_get_all_filter_by_project(self, db_session: Session, sample_project_wit
             area_id=sample_area.id,
         )
         db_session.add(other_project)
-        db_session.commit()
+        db_session.flush()
 
         other_task = Task(
             title="Other Task",
@@ -298,7 +273,7 @@ def test_get_all_filter_by_project(self, db_session: Session, sample_project_wit
             priority=5,
         )
         db_session.add(other_task)
-        db_session.commit()
+        db_session.flush()
 
         # Filter by original project
         tasks, total = TaskService.get_all(db_session, project_id=sample_project_with_tasks.id)
@@ -332,7 +307,7 @@ def test_get_all_filter_by_context(self, db_session: Session, sample_project: Pr
             context="@phone",
         )
         db_session.add_all([task1, task2])
-        db_session.commit()
+        db_session.flush()
 
         tasks, total = TaskService.get_all(db_session, context="@computer")
 
@@ -356,7 +331,7 @@ def test_get_all_filter_by_energy_level(self, db_session: Session, sample_projec
             energy_level="low",
         )
         db_session.add_all([task1, task2])
-        db_session.commit()
+        db_session.flush()
 
         tasks, total = TaskService.get_all(db_session, energy_level="high")
 
@@ -373,15 +348,19 @@ def test_get_all_filter_by_next_action(self, db_session: Session, sample_project
     def test_get_all_filter_by_priority_range(self, db_session: Session, sample_project: Project):
         """Test get_all with priority range filter."""
         # Create tasks with various priorities
-        for i in range(1, 6):
-            task = Task(
-                title=f"Priority {i} Task",
-                project_id=sample_project.id,
-                status="pending",
-                priority=i,
-            )
-            db_session.add(task)
-        db_session.commit()
+        db_session.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"Priority {i} Task",
+                    "project_id": sample_project.id,
+                    "status": "pending",
+                    "priority": i,
+                }
+                for i in range(1, 6)
+            ],
+        )
+        db_session.flush()
 
         # Get priorities 2-4
         tasks, total = TaskService.get_all(db_session, priority_min=2, priority_max=4)
@@ -393,26 +372,29 @@ def test_get_all_filter_by_priority_range(self, db_session: Session, sample_proj
     def test_get_all_pagination(self, db_session: Session, sample_project: Project):
         """Test get_all with pagination."""
         # Create 5 tasks
-        for i in range(5):
-            task = Task(
-                title=f"Task {i}",
-                project_id=sample_project.id,
-                status="pending",
-                priority=5,
-            )
-            db_session.add(task)
-        db_session.commit()
-
-        tasks_page1, total = TaskService.get_all(db_session, skip=0, limit=2)
+        db_session.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"Task {i}",
+                    "project_id": sample_project.id,
+                    "status": "pending",
+                    "priority": 5,
+                }
+                for i in range(5)
+            ],
+        )
+        db_session.flush()
+
+        all_tasks, total = TaskService.get_all(db_session, skip=0, limit=100)
         tasks_page2, _ = TaskService.get_all(db_session, skip=2, limit=2)
 
         assert total == 5
-        assert len(tasks_page1) == 2
+        assert len(all_tasks) == 5
         assert len(tasks_page2) == 2
-        # Different tasks on each page
-        page1_ids = {t.id for t in tasks_page1}
-        page2_ids = {t.id for t in tasks_page2}
-        assert page1_ids.isdisjoint(page2_ids)
+        # A page is the matching slice of the full ordering, disjoint from the page before it
+        assert [t.id for t in tasks_page2] == [t.id for t in all_tasks[2:4]]
+        assert {t.id for t in all_tasks[:2]}.isdisjoint(t.id for t in tasks_page2)
 
 
 class TestTaskServiceComplete:
@@ -458,48 +440,40 @@ def test_start_task_not_found(self, db_session: Session):
 class TestTaskServiceQueries:
     """Test TaskService specialized query methods."""
 
-    def test_get_by_context(self, db_session: Session, sample_project: Project):
+    def test_get_by_context(self, db_session: Session, sample_project: Project, query_counter):
         """Test getting tasks by context."""
         # Create tasks with context
-        task1 = Task(
-            title="Computer Task 1",
-            project_id=sample_project.id,
-            status="pending",
-            priority=5,
-            context="@computer",
-        )
-        task2 = Task(
-            title="Computer Task 2",
-            project_id=sample_project.id,
-            status="in_progress",
-            priority=3,
-            context="@computer",
-        )
-        task3 = Task(
-            title="Phone Task",
-            project_id=sample_project.id,
-            status="pending",
-            priority=5,
-            context="@phone",
-        )
-        task4 = Task(
-            title="Completed Computer Task",
-            project_id=sample_project.id,
-            status="completed",
-            priority=5,
-            context="@computer",
-        )
-        db_session.add_all([task1, task2, task3, task4])
-        db_session.commit()
-
-        results = TaskService.get_by_context(db_session, "@computer")
-
-        # Should return 2 (excludes completed)
-        assert len(results) == 2
-        assert all(t.context == "@computer" for t in results)
-        assert all(t.status in ["pending", "in_progress"] for t in results)
-
-    def test_get_overdue(self, db_session: Session, sample_project: Project):
+        db_session.execute(
+            insert(Task),
+            [
+                {
+                    "title": title,
+                    "project_id": sample_project.id,
+                    "status": status,
+                    "priority": priority,
+                    "context": context,
+                }
+                for title, status, priority, context in [
+                    ("Computer Task 1", "pending", 5, "@computer"),
+                    ("Computer Task 2", "in_progress", 3, "@computer"),
+                    ("Phone Task", "pending", 5, "@phone"),
+                    ("Completed Computer Task", "completed", 5, "@computer"),
+                ]
+            ],
+        )
+        db_session.flush()
+
+        with query_counter:
+            results = TaskService.get_by_context(db_session, "@computer")
+
+            # Should return 2 (excludes completed)
+            assert len(results) == 2
+            assert all(t.context == "@computer" for t in results)
+            assert all(t.status in ["pending", "in_progress"] for t in results)
+
+        assert query_counter.count == 1, query_counter.statements
+
+    def test_get_overdue(self, db_session: Session, sample_project: Project, query_counter):
         """Test getting overdue tasks."""
         yesterday = date.today() - timedelta(days=1)
         tomorrow = date.today() + timedelta(days=1)
@@ -529,12 +503,15 @@ def test_get_overdue(self, db_session: Session, sample_project: Project):
             due_date=yesterday,
         )
         db_session.add_all([overdue_task, future_task, completed_overdue])
-        db_session.commit()
+        db_session.flush()
 
-        results = TaskService.get_overdue(db_session)
+        with query_counter:
+            results = TaskService.get_overdue(db_session)
 
-        assert len(results) == 1
-        assert results[0].title == "Overdue Task"
+            assert len(results) == 1
+            assert results[0].title == "Overdue Task"
+
+        assert query_counter.count == 1, query_counter.statements
 
     def test_get_two_minute_tasks(self, db_session: Session, sample_project: Project):
         """Test getting two-minute tasks."""
@@ -563,7 +540,7 @@ def test_get_two_minute_tasks(self, db_session: Session, sample_project: Project
             is_two_minute_task=True,
         )
         db_session.add_all([quick_task, normal_task, completed_quick])
-        db_session.commit()
+        db_session.flush()
 
         results = TaskService.get_two_minute_tasks(db_session)
 
@@ -595,7 +572,7 @@ def test_search_by_title(self, db_session: Session, sample_project: Project):
             priority=5,
         )
         db_session.add_all([task1, task2, task3])
-        db_session.commit()
+        db_session.flush()
 
         results = TaskService.search(db_session, "Meeting")
 
@@ -614,7 +591,7 @@ def test_search_by_description(self, db_session: Session, sample_project: Projec
             priority=5,
         )
         db_session.add(task)
-        db_session.commit()
+        db_session.flush()
 
         results = TaskService.search(db_session, "machine learning")
 
@@ -630,7 +607,7 @@ def test_search_case_insensitive(self, db_session: Session, sample_project: Proj
             priority=5,
         )
         db_session.add(task)
-        db_session.commit()
+        db_session.flush()
 
         results = TaskService.search(db_session, "important")
 
@@ -645,7 +622,7 @@ def test_search_no_results(self, db_session: Session, sample_project: Project):
             priority=5,
         )
         db_session.add(task)
-        db_session.commit()
+        db_session.flush()
 
         results = TaskService.search(db_session, "nonexistent")
 
@@ -654,16 +631,59 @@ def test_search_no_results(self, db_session: Session, sample_project: Project):
     def test_search_limit(self, db_session: Session, sample_project: Project):
         """Test search respects limit parameter."""
         # Create many tasks
-        for i in range(10):
-            task = Task(
-                title=f"Search Test Task {i}",
-                project_id=sample_project.id,
-                status="pending",
-                priority=5,
-            )
-            db_session.add(task)
-        db_session.commit()
+        db_session.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"Search Test Task {i}",
+                    "project_id": sample_project.id,
+                    "status": "pending",
+                    "priority": 5,
+                }
+                for i in range(10)
+            ],
+        )
+        db_session.flush()
 
         results = TaskService.search(db_session, "Search Test", limit=3)
 
         assert len(results) == 3
+
+
+class TestTaskServiceStatementCache:
+    """Test that repeated TaskService queries reuse SQLAlchemy's compiled-statement cache."""
+
+    def test_queries_hit_compiled_cache(
+        self, db_session: Session, sample_project: Project, query_counter
+    ):
+        """Calls that differ only in parameter values should not recompile their SQL."""
+        # (method, warm-up kwargs, repeat kwargs): same query shape, different values
+        calls = [
+            (
+                TaskService.search,
+                {"search_term": "warm", "limit": 1},
+                {"search_term": "other", "limit": 7},
+            ),
+            (
+                TaskService.get_by_context,
+                {"context": "@warm", "limit": 1},
+                {"context": "@other", "limit": 7},
+            ),
+            (TaskService.get_overdue, {"limit": 1}, {"limit": 7}),
+            (TaskService.get_two_minute_tasks, {"limit": 1}, {"limit": 7}),
+            (
+                TaskService.get_all,
+                {"context": "@warm", "skip": 1, "limit": 1},
+                {"context": "@other", "skip": 7, "limit": 7},
+            ),
+            (TaskService.get_by_id, {"task_id": 1}, {"task_id": 7}),
+        ]
+        for method, warm_kwargs, _ in calls:
+            method(db_session, **warm_kwargs)
+
+        with query_counter:
+            for method, _, repeat_kwargs in calls:
+                method(db_session, **repeat_kwargs)
+
+        assert query_counter.count
+        assert not query_counter.cache_misses, query_counter.cache_misses
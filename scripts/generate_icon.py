@@ -10,12 +10,16 @@
     python scripts/generate_icon.py
 
 Output:
-    assets/conduital.ico (multi-resolution: 16, 32, 48, 64, 128, 256)
+    assets/conduital.ico (multi-resolution: 16, 32, 48, 256)
+    assets/conduital-<size>.png (16, 32, 48, 64, 128, 256)
 """
 
+import io
 import math
 import os
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -23,25 +27,38 @@
     print("ERROR: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+# zlib level for PNG output: icons are tiny, so level 1 costs a few KB and
+# encodes several times faster than Pillow's default of 6
+PNG_COMPRESS_LEVEL = 1
+
+# Unit-circle points for the ends of the "C" arc (Pillow angles run clockwise from 3 o'clock)
+_COS_NEG45, _SIN_NEG45 = math.cos(math.radians(-45)), math.sin(math.radians(-45))
+_COS_45, _SIN_45 = math.cos(math.radians(45)), math.sin(math.radians(45))
+_COS_NEG50, _SIN_NEG50 = math.cos(math.radians(-50)), math.sin(math.radians(-50))
+
+
+def _vertical_gradient(width: int, height: int, top: tuple, bottom: tuple) -> Image.Image:
+    """Opaque RGBA image fading from ``top`` to ``bottom`` colour down its height.
+
+    Colours are computed once per row into a 1px-wide column, which Pillow then
+    stretches horizontally in C instead of drawing one line per row.
+    """
+    column = bytearray()
+    for y in range(height):
+        t = y / max(1, height - 1)
+        column += bytes(int(c0 + t * (c1 - c0)) for c0, c1 in zip(top, bottom))
+        column.append(255)
+    return Image.frombytes("RGBA", (1, height), bytes(column)).resize(
+        (width, height), Image.NEAREST
+    )
+
 
 def draw_icon(size: int) -> Image.Image:
     """Draw the Conduital icon at the given size."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
     # --- Background: rounded square with deep blue gradient ---
     margin = max(1, size // 32)
     corner_radius = max(2, size // 5)
 
-    # Draw rounded rectangle background
-    # Gradient from top-left (#2563eb, blue-600) to bottom-right (#1e40af, blue-800)
-    for y in range(size):
-        t = y / max(1, size - 1)
-        r = int(30 + t * (15 - 30))    # 30 -> 15
-        g = int(99 + t * (64 - 99))    # 99 -> 64
-        b = int(235 + t * (175 - 235)) # 235 -> 175
-        draw.line([(margin, y), (size - margin - 1, y)], fill=(r, g, b, 255))
-
     # Create rounded corner mask
     mask = Image.new("L", (size, size), 0)
     mask_draw = ImageDraw.Draw(mask)
@@ -50,23 +67,17 @@ def draw_icon(size: int) -> Image.Image:
         radius=corner_radius,
         fill=255,
     )
-    img.putalpha(mask)
-
-    # Re-create draw on the masked image
-    # We need to draw the gradient again properly within the mask
-    bg = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    bg_draw = ImageDraw.Draw(bg)
-    for y in range(size):
-        t = y / max(1, size - 1)
-        r = int(37 + t * (30 - 37))
-        g = int(99 + t * (64 - 99))
-        b = int(235 + t * (175 - 235))
-        bg_draw.line([(0, y), (size - 1, y)], fill=(r, g, b, 255))
-
-    # Apply rounded rect mask to gradient
-    result = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    result.paste(bg, mask=mask)
-    draw = ImageDraw.Draw(result)
+
+    # Gradient from top (#2563eb, blue-600) to bottom (#1e40af, blue-800),
+    # with the rounded rect mask as its alpha channel
+    result = _vertical_gradient(size, size, (37, 99, 235), (30, 64, 175))
+    result.putalpha(mask)
+
+    # Strokes go on their own layer and are blended over the background in one
+    # composite; drawing straight onto it would overwrite the background's alpha
+    # with the strokes' partial alpha and leave see-through lines.
+    fg = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(fg)
 
     # --- Foreground: Stylized momentum conduit ---
     # Design: An upward-right arrow/chevron shape suggesting flow
@@ -96,8 +107,8 @@ def draw_icon(size: int) -> Image.Image:
         arc_cx = cx
         arc_cy = cy
         arc_r = (size - 2 * bbox_inset) / 2
-        top_x = arc_cx + arc_r * math.cos(math.radians(-45))
-        top_y = arc_cy + arc_r * math.sin(math.radians(-45))
+        top_x = arc_cx + arc_r * _COS_NEG45
+        top_y = arc_cy + arc_r * _SIN_NEG45
 
         # Arrow head pointing upper-right
         arrow_tip_x = top_x + arrow_len * 0.7
@@ -130,8 +141,8 @@ def draw_icon(size: int) -> Image.Image:
         )
 
         # Bottom momentum streak (from bottom of C)
-        bottom_x = arc_cx + arc_r * math.cos(math.radians(45))
-        bottom_y = arc_cy + arc_r * math.sin(math.radians(45))
+        bottom_x = arc_cx + arc_r * _COS_45
+        bottom_y = arc_cy + arc_r * _SIN_45
         streak_len = unit * 1.8
         draw.line(
             [(bottom_x, bottom_y), (bottom_x + streak_len * 0.7, bottom_y + streak_len * 0.3)],
@@ -148,8 +159,8 @@ def draw_icon(size: int) -> Image.Image:
 
         # Simple arrow at top-right
         arc_r = (size - 2 * bbox_inset) / 2
-        top_x = cx + arc_r * math.cos(math.radians(-50))
-        top_y = cy + arc_r * math.sin(math.radians(-50))
+        top_x = cx + arc_r * _COS_NEG50
+        top_y = cy + arc_r * _SIN_NEG50
         arrow_len = unit * 2
         tip_x = top_x + arrow_len * 0.6
         tip_y = top_y - arrow_len * 0.6
@@ -165,12 +176,50 @@ def draw_icon(size: int) -> Image.Image:
         bbox = [bbox_inset, bbox_inset, size - bbox_inset, size - bbox_inset]
         draw.arc(bbox, start=50, end=310, fill=(255, 255, 255, 255), width=pen_width)
 
-    return result
+    return Image.alpha_composite(result, fg)
+
+
+def _encode_png(img: Image.Image) -> bytes:
+    """Encode an image as PNG bytes."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buf.getvalue()
+
+
+def _write_ico(path: str, frames: list[tuple[int, bytes]]) -> None:
+    """Write a .ico whose images are the given ``(size, png_bytes)`` frames.
+
+    Vista+ icons may embed PNG data directly, so the frames are stored as-is
+    rather than re-encoded by Pillow's ICO writer.
+    """
+    header = struct.pack("<HHH", 0, 1, len(frames))  # reserved, type=icon, count
+    offset = len(header) + 16 * len(frames)
+    entries = b""
+    for size, data in frames:
+        dim = 0 if size >= 256 else size  # 0 means 256
+        # width, height, palette colours, reserved, planes, bits per pixel, size, offset
+        entries += struct.pack("<BBBBHHII", dim, dim, 0, 0, 1, 32, len(data), offset)
+        offset += len(data)
+    with open(path, "wb") as f:
+        f.write(header + entries + b"".join(data for _, data in frames))
 
 
 def main():
     sizes = [16, 32, 48, 64, 128, 256]
-    images = [draw_icon(s) for s in sizes]
+    # Windows requires 16/32/48/256 in an .ico and scales 256 down for the rest
+    ico_sizes = [16, 32, 48, 256]
+
+    # 48px and up share the detailed design, so render it once at full size and
+    # downscale; 16 and 32 have their own simplified designs.
+    master = draw_icon(max(sizes))
+    images = []
+    for s in sizes:
+        if s < 48:
+            images.append(draw_icon(s))
+        elif s == master.width:
+            images.append(master)
+        else:
+            images.append(master.resize((s, s), Image.LANCZOS))
 
     # Determine output path
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -180,21 +229,23 @@ def main():
 
     ico_path = os.path.join(assets_dir, "conduital.ico")
 
-    # Save as .ico with all sizes
-    images[0].save(
-        ico_path,
-        format="ICO",
-        sizes=[(s, s) for s in sizes],
-        append_images=images[1:],
-    )
+    # Encode each size to PNG once; the same bytes go into the .ico and the
+    # standalone files. Pillow releases the GIL while encoding, so the sizes
+    # compress in parallel.
+    with ThreadPoolExecutor(max_workers=min(len(sizes), os.cpu_count() or 1)) as pool:
+        png_data = list(pool.map(_encode_png, images))
+
+    # Save as .ico with the standard Windows sizes
+    _write_ico(ico_path, [(s, data) for s, data in zip(sizes, png_data) if s in ico_sizes])
 
     print(f"Icon saved to {ico_path}")
-    print(f"Sizes: {', '.join(f'{s}x{s}' for s in sizes)}")
+    print(f"Sizes: {', '.join(f'{s}x{s}' for s in ico_sizes)}")
 
     # Also save individual PNGs for reference
-    for img, s in zip(images, sizes):
+    for s, data in zip(sizes, png_data):
         png_path = os.path.join(assets_dir, f"conduital-{s}.png")
-        img.save(png_path)
+        with open(png_path, "wb") as f:
+            f.write(data)
     print(f"Individual PNGs saved to {assets_dir}")
 
 